@@ -1,10 +1,17 @@
 import argparse
 import sys
+from typing import Optional
+
 import pandas as pd
+import requests
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 
-from utils.extract import scrape_products
+from utils.extract import make_session, scrape_products
 from utils.transform import transform_products
-from utils.load import save_to_csv
+from utils.load import save_to_csv, save_to_postgresql
+from utils.profile import StageProfiler, make_run_dir, stage
+from utils.scheduler import PipelineScheduler
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Fashion Studio ETL Pipeline")
@@ -12,37 +19,120 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--end-page", type=int, default=50)
     parser.add_argument("--output-csv", default="products.csv")
     parser.add_argument("--raw-csv", default="raw_products.csv")
+    parser.add_argument("--profile", action="store_true", help="Record per-stage CPU and allocation profiles")
+    parser.add_argument("--profile-dir", default="profiles")
+    parser.add_argument("--postgres-uri", default=None)
+    parser.add_argument("--postgres-table", default="products")
+    parser.add_argument("--serve", action="store_true", help="Keep running and execute the pipeline on a schedule")
+    parser.add_argument("--interval", type=float, default=300.0, help="Seconds between scheduled runs (0 = trigger only)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
     return parser.parse_args()
 
-def run_pipeline(start_page: int, end_page: int, output_csv: str, raw_csv: str) -> int:
+def run_pipeline(
+    start_page: int,
+    end_page: int,
+    output_csv: str,
+    raw_csv: str,
+    profiler: Optional[StageProfiler] = None,
+    session: Optional[requests.Session] = None,
+    postgres_uri: Optional[str] = None,
+    postgres_table: str = "products",
+    engine: Optional[Engine] = None,
+) -> int:
     try: 
-        rows = scrape_products(start_page=start_page, end_page=end_page, delay_sec=0.1)
+        rows = scrape_products(
+            start_page=start_page,
+            end_page=end_page,
+            delay_sec=0.1,
+            profiler=profiler,
+            session=session,
+        )
         if not rows:
             print("[MAIN] No data extracted.")
             return 1
 
         df_raw = pd.DataFrame(rows)
-        df_raw.to_csv(raw_csv, index=False)
+        with stage(profiler, "load_raw_csv"):
+            df_raw.to_csv(raw_csv, index=False)
         print(f"[MAIN] Raw saved: {raw_csv} ({len(df_raw)} rows)")
 
-        df_clean = transform_products(df_raw, exchange_rate=16000)
+        with stage(profiler, "transform_products"):
+            df_clean = transform_products(df_raw, exchange_rate=16000)
         print(f"[MAIN] Clean rows: {len(df_clean)}")
 
-        save_to_csv(df_clean, output_csv)
+        with stage(profiler, "load_csv"):
+            save_to_csv(df_clean, output_csv)
         print(f"[MAIN] Final CSV saved: {output_csv}")
+
+        if postgres_uri:
+            with stage(profiler, "load_postgresql"):
+                save_to_postgresql(df_clean, postgres_uri, postgres_table, engine=engine)
+            print(f"[MAIN] PostgreSQL table saved: {postgres_table}")
         return 0
 
     except Exception as exc:
         print(f"{exc}")
         return 1
     
-if __name__ == "__main__":
+def serve(args: argparse.Namespace) -> int:
+    session = make_session()
+    engine = create_engine(args.postgres_uri, pool_pre_ping=True) if args.postgres_uri else None
+
+    def run() -> int:
+        return run_pipeline(
+            start_page=args.start_page,
+            end_page=args.end_page,
+            raw_csv=args.raw_csv,
+            output_csv=args.output_csv,
+            session=session,
+            postgres_uri=args.postgres_uri,
+            postgres_table=args.postgres_table,
+            engine=engine,
+        )
+
+    scheduler = PipelineScheduler(run, interval_sec=args.interval)
+    try:
+        scheduler.start_server(args.host, args.port)
+        scheduler.serve_forever()
+    except KeyboardInterrupt:
+        print("[SCHEDULER] Shutting down")
+    finally:
+        scheduler.stop()
+        session.close()
+        if engine is not None:
+            engine.dispose()
+    return 0
+
+
+def main() -> int:
     args = parse_args()
-    sys.exit(
-        run_pipeline(
+    if args.serve:
+        return serve(args)
+    if not args.profile:
+        return run_pipeline(
             start_page=args.start_page,
             end_page=args.end_page,
             raw_csv=args.raw_csv,
             output_csv=args.output_csv,
+            postgres_uri=args.postgres_uri,
+            postgres_table=args.postgres_table,
         )
-    )
\ No newline at end of file
+
+    profiler = StageProfiler(make_run_dir(args.profile_dir))
+    with profiler:
+        code = run_pipeline(
+            start_page=args.start_page,
+            end_page=args.end_page,
+            raw_csv=args.raw_csv,
+            output_csv=args.output_csv,
+            profiler=profiler,
+            postgres_uri=args.postgres_uri,
+            postgres_table=args.postgres_table,
+        )
+    print(f"[PROFILE] Stage profiles saved: {profiler.run_dir}")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -8,6 +8,7 @@ from utils.extract import (
     parse_page,
     scrape_products,
     ExtractError,
+    PRICE_PATTERN,
 )
 from bs4 import BeautifulSoup
 
@@ -82,6 +83,12 @@ class TestFindTextByPattern:
         result = _find_text_by_pattern(card, r"rating|/ 5")
         assert result is not None
 
+    def test_find_with_compiled_pattern(self):
+        html = '<div><span>Price: $10.50</span></div>'
+        card = BeautifulSoup(html, "html.parser").find("div")
+        result = _find_text_by_pattern(card, PRICE_PATTERN)
+        assert result == "Price: $10.50"
+
     def test_pattern_not_found(self):
         html = '<div><span>No match here</span></div>'
         card = BeautifulSoup(html, "html.parser").find("div")
@@ -0,0 +1,85 @@
+import os
+import time
+
+import pytest
+from unittest.mock import patch
+from utils.profile import StageProfiler, make_run_dir, stage
+from utils.extract import scrape_products
+
+
+def _busy(seconds: float) -> list:
+    end = time.perf_counter() + seconds
+    junk = []
+    while time.perf_counter() < end:
+        junk.append("x" * 100)
+    return junk
+
+
+class TestMakeRunDir:
+    def test_creates_directory(self, tmp_path):
+        run_dir = make_run_dir(str(tmp_path))
+        assert os.path.isdir(run_dir)
+        assert os.path.dirname(run_dir) == str(tmp_path)
+
+
+class TestStageProfiler:
+    def test_invalid_interval_raises_error(self, tmp_path):
+        with pytest.raises(ValueError):
+            StageProfiler(str(tmp_path), interval_sec=0)
+
+    def test_invalid_top_n_raises_error(self, tmp_path):
+        with pytest.raises(ValueError):
+            StageProfiler(str(tmp_path), top_n=0)
+
+    def test_writes_per_stage_files(self, tmp_path):
+        with StageProfiler(str(tmp_path), interval_sec=0.001) as profiler:
+            with profiler.stage("transform_products"):
+                _busy(0.05)
+
+        for suffix in [".prof", ".txt", ".collapsed", ".alloc.txt"]:
+            assert (tmp_path / f"transform_products{suffix}").exists()
+        assert "transform_products\t1\t" in (tmp_path / "summary.tsv").read_text()
+
+    def test_collapsed_stack_format(self, tmp_path):
+        with StageProfiler(str(tmp_path), interval_sec=0.001) as profiler:
+            with profiler.stage("parse_page"):
+                _busy(0.1)
+
+        lines = (tmp_path / "parse_page.collapsed").read_text().splitlines()
+        assert lines
+        stack, count = lines[0].rsplit(" ", 1)
+        assert int(count) > 0
+        assert "_busy (test_profile.py:" in stack.split(";")[-1]
+
+    def test_repeated_stage_accumulates(self, tmp_path):
+        with StageProfiler(str(tmp_path)) as profiler:
+            for _ in range(3):
+                with profiler.stage("fetch"):
+                    pass
+
+        assert "fetch\t3\t" in (tmp_path / "summary.tsv").read_text()
+        assert (tmp_path / "fetch.alloc.txt").read_text().count("# fetch boundary") == 3
+
+    def test_nested_stage_raises_error(self, tmp_path):
+        with StageProfiler(str(tmp_path)) as profiler:
+            with profiler.stage("fetch"):
+                with pytest.raises(RuntimeError):
+                    with profiler.stage("parse_page"):
+                        pass
+
+
+class TestStageHelper:
+    def test_none_profiler_is_noop(self):
+        with stage(None, "fetch"):
+            pass
+
+    @patch("utils.extract.time.sleep")
+    @patch("utils.extract.fetch_html")
+    def test_scrape_products_records_stages(self, mock_fetch, mock_sleep, tmp_path):
+        mock_fetch.return_value = "<html><body></body></html>"
+        with StageProfiler(str(tmp_path)) as profiler:
+            scrape_products(start_page=1, end_page=2, delay_sec=0, profiler=profiler)
+
+        summary = (tmp_path / "summary.tsv").read_text()
+        assert "fetch\t2\t" in summary
+        assert "parse_page\t2\t" in summary
@@ -0,0 +1,109 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+from utils.scheduler import PipelineScheduler
+
+
+def _blocking_run(release: threading.Event, code: int = 0):
+    def run() -> int:
+        release.wait(5)
+        return code
+    return run
+
+
+class TestPipelineScheduler:
+    def test_negative_interval_raises_error(self):
+        with pytest.raises(ValueError):
+            PipelineScheduler(lambda: 0, interval_sec=-1)
+
+    def test_trigger_records_stats(self):
+        scheduler = PipelineScheduler(lambda: 0, interval_sec=0)
+        assert scheduler.trigger() is True
+        scheduler.stop(timeout=5)
+
+        stats = scheduler.stats()
+        assert stats["runs"] == 1
+        assert stats["failures"] == 0
+        assert stats["last_exit_code"] == 0
+        assert stats["in_flight"] is False
+
+    def test_skips_tick_while_in_flight(self):
+        release = threading.Event()
+        scheduler = PipelineScheduler(_blocking_run(release), interval_sec=0)
+        assert scheduler.trigger() is True
+        assert scheduler.trigger() is False
+        assert scheduler.stats()["in_flight"] is True
+
+        release.set()
+        scheduler.stop(timeout=5)
+        stats = scheduler.stats()
+        assert stats["runs"] == 1
+        assert stats["skipped"] == 1
+
+    def test_exception_counts_as_failure(self):
+        def boom() -> int:
+            raise RuntimeError("network down")
+
+        scheduler = PipelineScheduler(boom, interval_sec=0)
+        scheduler.trigger()
+        scheduler.stop(timeout=5)
+
+        stats = scheduler.stats()
+        assert stats["failures"] == 1
+        assert stats["last_error"] == "network down"
+
+    def test_interval_loop_runs_until_stopped(self):
+        done = threading.Event()
+        calls = []
+
+        def run() -> int:
+            calls.append(1)
+            if len(calls) >= 2:
+                done.set()
+            return 0
+
+        scheduler = PipelineScheduler(run, interval_sec=0.01)
+        loop = threading.Thread(target=scheduler.serve_forever)
+        loop.start()
+        assert done.wait(5)
+        scheduler.stop(timeout=5)
+        loop.join(5)
+        assert not loop.is_alive()
+
+
+class TestTriggerEndpoint:
+    def test_run_and_stats_endpoints(self):
+        release = threading.Event()
+        scheduler = PipelineScheduler(_blocking_run(release), interval_sec=0)
+        server = scheduler.start_server("127.0.0.1", 0)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+
+        try:
+            resp = urllib.request.urlopen(urllib.request.Request(f"{base}/run", method="POST"))
+            assert resp.status == 202
+
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(urllib.request.Request(f"{base}/run", method="POST"))
+            assert exc_info.value.code == 409
+
+            release.set()
+            scheduler._worker.join(5)
+            stats = json.loads(urllib.request.urlopen(f"{base}/stats").read())
+            assert stats["runs"] == 1
+            assert stats["skipped"] == 1
+        finally:
+            release.set()
+            scheduler.stop(timeout=5)
+
+    def test_unknown_path_returns_404(self):
+        scheduler = PipelineScheduler(lambda: 0, interval_sec=0)
+        server = scheduler.start_server("127.0.0.1", 0)
+        try:
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/nope")
+            assert exc_info.value.code == 404
+        finally:
+            scheduler.stop(timeout=5)
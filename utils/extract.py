@@ -1,13 +1,22 @@
 import re
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Pattern, Union
 
 import requests
 from bs4 import BeautifulSoup, Tag
 
+from utils.profile import StageProfiler, stage
+
 BASE_URL = "https://fashion-studio.dicoding.dev"
 TIMEOUT = 20
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/122 Safari/537.36"
+
+PRICE_PATTERN = re.compile(r"\$\s*[\d.,]+", re.IGNORECASE)
+RATING_PATTERN = re.compile(r"rating|/ 5", re.IGNORECASE)
+COLORS_PATTERN = re.compile(r"\b\d+\s*colors?\b", re.IGNORECASE)
+SIZE_PATTERN = re.compile(r"size\s*:", re.IGNORECASE)
+GENDER_PATTERN = re.compile(r"gender\s*:", re.IGNORECASE)
 
 class ExtractError(Exception):
     pass
@@ -19,6 +28,11 @@ def build_page_url(page: int) -> str:
         return f"{BASE_URL}/"
     return f"{BASE_URL}/page{page}"
 
+def make_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
 def fetch_html(session: requests.Session, url: str) -> str:
     try:
         resp = session.get(url, timeout=TIMEOUT)
@@ -38,8 +52,8 @@ def _find_title(card: Tag) -> Optional[str]:
     return None
 
 
-def _find_text_by_pattern(card: Tag, pattern: str) -> Optional[str]:
-    rgx = re.compile(pattern, re.IGNORECASE)
+def _find_text_by_pattern(card: Tag, pattern: Union[str, Pattern[str]]) -> Optional[str]:
+    rgx = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, re.IGNORECASE)
     for txt in card.stripped_strings:
         if rgx.search(txt):
             return txt.strip()
@@ -48,11 +62,11 @@ def _find_text_by_pattern(card: Tag, pattern: str) -> Optional[str]:
 def parse_product_card(card: Tag, ts: str) -> Optional[Dict[str, str]]:
     try:
         title = _find_title(card)
-        price = _find_text_by_pattern(card, r"\$\s*[\d.,]+")
-        rating = _find_text_by_pattern(card, r"rating|/ 5")
-        colors = _find_text_by_pattern(card, r"\b\d+\s*colors?\b")
-        size = _find_text_by_pattern(card, r"size\s*:")
-        gender = _find_text_by_pattern(card, r"gender\s*:")
+        price = _find_text_by_pattern(card, PRICE_PATTERN)
+        rating = _find_text_by_pattern(card, RATING_PATTERN)
+        colors = _find_text_by_pattern(card, COLORS_PATTERN)
+        size = _find_text_by_pattern(card, SIZE_PATTERN)
+        gender = _find_text_by_pattern(card, GENDER_PATTERN)
 
         if not all([title, price, rating, colors, size, gender]):
             return None
@@ -87,23 +101,29 @@ def parse_page(html: str, ts: str) -> List[Dict[str, str]]:
     return rows
 
 
-def scrape_products(start_page: int = 1, end_page: int = 50, delay_sec: float = 0.1) -> List[Dict[str, str]]:
+def scrape_products(
+    start_page: int = 1,
+    end_page: int = 50,
+    delay_sec: float = 0.1,
+    profiler: Optional[StageProfiler] = None,
+    session: Optional[requests.Session] = None,
+) -> List[Dict[str, str]]:
     if start_page < 1 or end_page < start_page:
         raise ValueError("Invalid page range")
 
     ts = datetime.now().isoformat(timespec="seconds")
     results: List[Dict[str, str]] = []
 
-    session = requests.Session()
-    session.headers.update(
-        {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/122 Safari/537.36"}
-    )
+    if session is None:
+        session = make_session()
 
     for page in range(start_page, end_page + 1):
         url = build_page_url(page)
         try:
-            html = fetch_html(session, url)
-            rows = parse_page(html, ts)
+            with stage(profiler, "fetch"):
+                html = fetch_html(session, url)
+            with stage(profiler, "parse_page"):
+                rows = parse_page(html, ts)
             results.extend(rows)
             print(f"[EXTRACT] page={page}, rows={len(rows)}")
         except Exception as exc:
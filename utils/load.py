@@ -1,5 +1,8 @@
+from typing import Optional
+
 import pandas as pd
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 
 
 def save_to_csv(df: pd.DataFrame, output_path: str) -> None:
@@ -10,7 +13,12 @@ def save_to_csv(df: pd.DataFrame, output_path: str) -> None:
     df.to_csv(output_path, index=False)
 
 
-def save_to_postgresql(df: pd.DataFrame, connection_uri: str, table_name: str = "products") -> None:
+def save_to_postgresql(
+    df: pd.DataFrame,
+    connection_uri: str,
+    table_name: str = "products",
+    engine: Optional[Engine] = None,
+) -> None:
     if df is None or df.empty:
         raise ValueError("DataFrame is empty, cannot save to PostgreSQL")
     if not connection_uri:
@@ -18,7 +26,8 @@ def save_to_postgresql(df: pd.DataFrame, connection_uri: str, table_name: str =
     if not table_name:
         raise ValueError("table_name is required")
 
-    engine = create_engine(connection_uri)
+    if engine is None:
+        engine = create_engine(connection_uri)
     df.to_sql(table_name, engine, if_exists="replace", index=False)
 
 
@@ -0,0 +1,157 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from typing import ContextManager, Dict, Iterator, List, Optional
+
+SAMPLE_INTERVAL_SEC = 0.005
+TOP_N_ALLOCATIONS = 10
+
+
+def make_run_dir(base_dir: str) -> str:
+    run_dir = os.path.join(base_dir, datetime.now().strftime("%Y%m%d-%H%M%S"))
+    os.makedirs(run_dir, exist_ok=True)
+    return run_dir
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _collapse_stack(frame) -> str:
+    labels: List[str] = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class StageProfiler:
+    def __init__(self, run_dir: str, interval_sec: float = SAMPLE_INTERVAL_SEC, top_n: int = TOP_N_ALLOCATIONS):
+        if interval_sec <= 0:
+            raise ValueError("interval_sec must be > 0")
+        if top_n < 1:
+            raise ValueError("top_n must be >= 1")
+
+        self.run_dir = run_dir
+        self.interval_sec = interval_sec
+        self.top_n = top_n
+
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._samples: Dict[str, Counter] = {}
+        self._allocations: Dict[str, List[str]] = {}
+        self._wall: Dict[str, float] = {}
+        self._calls: Dict[str, int] = {}
+
+        self._active_stage: Optional[str] = None
+        self._active_thread: Optional[int] = None
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        os.makedirs(self.run_dir, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample_loop, name="stage-sampler", daemon=True)
+        self._sampler.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._write_outputs()
+
+    def __enter__(self) -> "StageProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if self._active_stage is not None:
+            raise RuntimeError(f"Stage '{name}' started while '{self._active_stage}' is active")
+
+        profile = self._profiles.setdefault(name, cProfile.Profile())
+        self._samples.setdefault(name, Counter())
+        before = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+
+        self._active_thread = threading.get_ident()
+        self._active_stage = name
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._wall[name] = self._wall.get(name, 0.0) + time.perf_counter() - started
+            self._calls[name] = self._calls.get(name, 0) + 1
+            self._active_stage = None
+            self._active_thread = None
+            if before is not None:
+                self._record_allocations(name, before)
+
+    def _record_allocations(self, name: str, before: tracemalloc.Snapshot) -> None:
+        after = tracemalloc.take_snapshot()
+        stats = after.compare_to(before, "lineno")[: self.top_n]
+        lines = [f"# {name} boundary {self._calls[name]}"]
+        lines.extend(str(stat) for stat in stats)
+        self._allocations.setdefault(name, []).append("\n".join(lines))
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval_sec):
+            stage = self._active_stage
+            thread_id = self._active_thread
+            if stage is None or thread_id is None:
+                continue
+            frame = sys._current_frames().get(thread_id)
+            if frame is not None:
+                self._samples[stage][_collapse_stack(frame)] += 1
+
+    def _write_outputs(self) -> None:
+        summary = ["stage\tcalls\twall_sec\tsamples"]
+        for name, profile in self._profiles.items():
+            base = os.path.join(self.run_dir, name)
+            profile.dump_stats(f"{base}.prof")
+
+            buf = io.StringIO()
+            pstats.Stats(profile, stream=buf).sort_stats("cumulative").print_stats(30)
+            with open(f"{base}.txt", "w", encoding="utf-8") as fh:
+                fh.write(buf.getvalue())
+
+            samples = self._samples.get(name, Counter())
+            with open(f"{base}.collapsed", "w", encoding="utf-8") as fh:
+                for stack, count in samples.most_common():
+                    fh.write(f"{stack} {count}\n")
+
+            with open(f"{base}.alloc.txt", "w", encoding="utf-8") as fh:
+                fh.write("\n\n".join(self._allocations.get(name, [])) + "\n")
+
+            summary.append(
+                f"{name}\t{self._calls.get(name, 0)}\t{self._wall.get(name, 0.0):.3f}\t{sum(samples.values())}"
+            )
+
+        with open(os.path.join(self.run_dir, "summary.tsv"), "w", encoding="utf-8") as fh:
+            fh.write("\n".join(summary) + "\n")
+
+
+def stage(profiler: Optional[StageProfiler], name: str) -> ContextManager[None]:
+    if profiler is None:
+        return nullcontext()
+    return profiler.stage(name)
@@ -0,0 +1,125 @@
+import json
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+
+class PipelineScheduler:
+    def __init__(self, run_fn: Callable[[], int], interval_sec: float = 300.0):
+        if interval_sec < 0:
+            raise ValueError("interval_sec must be >= 0")
+
+        self.run_fn = run_fn
+        self.interval_sec = interval_sec
+
+        self._run_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        self._stats: Dict[str, Any] = {
+            "runs": 0,
+            "failures": 0,
+            "skipped": 0,
+            "in_flight": False,
+            "last_started": None,
+            "last_finished": None,
+            "last_duration_sec": None,
+            "last_exit_code": None,
+            "last_error": None,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def trigger(self) -> bool:
+        if not self._run_lock.acquire(blocking=False):
+            with self._stats_lock:
+                self._stats["skipped"] += 1
+            print("[SCHEDULER][WARN] Previous run still in flight, skipping tick")
+            return False
+
+        with self._stats_lock:
+            self._stats["in_flight"] = True
+            self._stats["last_started"] = datetime.now().isoformat(timespec="seconds")
+        self._worker = threading.Thread(target=self._run_once, name="pipeline-run", daemon=True)
+        self._worker.start()
+        return True
+
+    def _run_once(self) -> None:
+        started = time.perf_counter()
+        code: Optional[int] = None
+        error: Optional[str] = None
+        try:
+            code = self.run_fn()
+        except Exception as exc:
+            error = str(exc)
+        finally:
+            duration = round(time.perf_counter() - started, 3)
+            with self._stats_lock:
+                self._stats["runs"] += 1
+                if error is not None or code != 0:
+                    self._stats["failures"] += 1
+                self._stats["in_flight"] = False
+                self._stats["last_finished"] = datetime.now().isoformat(timespec="seconds")
+                self._stats["last_duration_sec"] = duration
+                self._stats["last_exit_code"] = code
+                self._stats["last_error"] = error
+            self._run_lock.release()
+        print(f"[SCHEDULER] Run finished: exit_code={code}, duration={duration}s")
+
+    def start_server(self, host: str, port: int) -> ThreadingHTTPServer:
+        scheduler = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                if self.path == "/stats":
+                    self._send_json(200, scheduler.stats())
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def do_POST(self) -> None:
+                if self.path != "/run":
+                    self._send_json(404, {"error": "not found"})
+                elif scheduler.trigger():
+                    self._send_json(202, {"started": True})
+                else:
+                    self._send_json(409, {"started": False, "reason": "run in flight"})
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        threading.Thread(target=self._server.serve_forever, name="scheduler-http", daemon=True).start()
+        print(f"[SCHEDULER] Trigger endpoint: http://{host}:{self._server.server_address[1]}")
+        return self._server
+
+    def serve_forever(self) -> None:
+        if self.interval_sec > 0:
+            print(f"[SCHEDULER] Running every {self.interval_sec}s")
+            self.trigger()
+            while not self._stop.wait(self.interval_sec):
+                self.trigger()
+        else:
+            self._stop.wait()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._worker is not None:
+            self._worker.join(timeout)
@@ -3,10 +3,16 @@ from typing import Optional
 
 import pandas as pd
 
+PRICE_RE = re.compile(r"\$\s*([\d.,]+)")
+NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)")
+INTEGER_RE = re.compile(r"(\d+)")
+SIZE_PREFIX_RE = re.compile(r"(?i)^size\s*:\s*")
+GENDER_PREFIX_RE = re.compile(r"(?i)^gender\s*:\s*")
+
 def _parse_price_to_idr(value: str, exchange_rate: int =16000) -> Optional[int]:    
     if not isinstance(value, str):
         return None
-    m = re.search(r"\$\s*([\d.,]+)", value)
+    m = PRICE_RE.search(value)
     if not m:
         return None
     usd = m.group(1).replace(",", "")
@@ -19,7 +25,7 @@ def _parse_price_to_idr(value: str, exchange_rate: int =16000) -> Optional[int]:
 def _parse_rating(value: str) -> Optional[float]:
     if not isinstance(value, str):
         return None
-    m = re.search(r"(\d+(?:\.\d+)?)", value)
+    m = NUMBER_RE.search(value)
     if not m:
         return None
     try:
@@ -31,26 +37,26 @@ def _parse_rating(value: str) -> Optional[float]:
 def _parse_colors(value: str) -> Optional[int]:
     if not isinstance(value, str):
         return None
-    m = re.search(r"(\d+)", value)
+    m = INTEGER_RE.search(value)
     return int(m.group(1)) if m else None
 
 
 def _clean_size(value: str) -> Optional[str]:
     if not isinstance(value, str):
         return None
-    cleaned = re.sub(r"(?i)^size\s*:\s*", "", value).strip()
+    cleaned = SIZE_PREFIX_RE.sub("", value).strip()
     return cleaned or None
 
 def _clean_size(value: str) -> Optional[str]:
     if not isinstance(value, str):
         return None
-    cleaned = re.sub(r"(?i)^size\s*:\s*", "", value).strip()
+    cleaned = SIZE_PREFIX_RE.sub("", value).strip()
     return cleaned or None
 
 def _clean_gender(value: str) -> Optional[str]:
     if not isinstance(value, str):
         return None
-    cleaned = re.sub(r"(?i)^gender\s*:\s*", "", value).strip()
+    cleaned = GENDER_PREFIX_RE.sub("", value).strip()
     return cleaned or None
 
 